@@ -4,27 +4,55 @@ Main application file with all API endpoints
 
 ENVIRONMENT CONFIGURATION:
 - Automatically detects development vs production via FLASK_ENV
-- Local: Uses .env file (loaded by python-dotenv)
+- Local: Uses .env file (loaded by config.py)
 - Production: Uses environment variables from hosting platform
 """
 from flask import Flask, jsonify, request, send_from_directory
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
 from flask_cors import CORS
+from datetime import datetime, timezone
+from functools import lru_cache
+from werkzeug.exceptions import NotFound
+from werkzeug.security import safe_join
+import orjson
 from config import get_config
-from database import init_database, seed_sample_data
+from database import init_database, analyze_database, seed_sample_data, get_data_version
 import models
 import os
 
-# Load environment variables from .env file (for local development)
-from dotenv import load_dotenv
-load_dotenv()
-
 # ==================== APPLICATION SETUP ====================
 
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson
+    Makes jsonify() encode and request.get_json() parse with orjson
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        # Used by request.get_json(); orjson accepts the raw request bytes
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # orjson already returns bytes, so skip the str round-trip of dumps()
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default),
+            mimetype=self.mimetype
+        )
+
 # Get configuration based on environment
 config_class = get_config()
 
 # Create Flask app
-app = Flask(__name__, static_folder='../frontend', static_url_path='')
+# No built-in static route: with static_url_path='' it would match every
+# path first, so frontend files and the SPA fallback are served by
+# serve_static() below
+app = Flask(__name__, static_folder=None)
+app.json = OrjsonProvider(app)
 
 # Load configuration
 app.config.from_object(config_class)
@@ -39,28 +67,51 @@ CORS(app, resources={
     }
 })
 
-# Initialize database on first run
+# Compress JSON (and static) responses for clients that accept it
+Compress(app)
+
+# Initialize database on first run and refresh query planner statistics
 with app.app_context():
     init_database()
-    print(f"✅ Database initialized: {app.config['DATABASE_PATH']}")
+    app.logger.info('Database initialized: %s', app.config['DATABASE_PATH'])
+    analyze_database()
+
+# ==================== ERROR RESPONSES ====================
+
+ERROR_TEMPLATE = b'{"success":false,"error":%s}'
+
+def error_response(message, status=500):
+    """Build a {'success': False, 'error': message} response"""
+    body = ERROR_TEMPLATE % orjson.dumps(str(message))
+    return app.response_class(body, status=status, mimetype='application/json')
+
+# ==================== RESPONSE CACHE ====================
+
+# Serialized bodies of read-mostly endpoints, keyed by endpoint name.
+# Each entry is (version, body); a database write from any worker changes
+# the version, so stale bodies are never served
+response_cache = {}
+
+def cached_json_response(key, version, build):
+    """Return the cached body for key, rebuilding it when version changed"""
+    cached = response_cache.get(key)
+    if cached is None or cached[0] != version:
+        body = orjson.dumps({'success': True, 'data': build()})
+        cached = response_cache[key] = (version, body)
+    return app.response_class(cached[1], mimetype='application/json')
 
 # ==================== COURSE ENDPOINTS ====================
 
+COURSE_REQUIRED_FIELDS = frozenset(('name', 'code', 'color', 'credits', 'semester'))
+
 @app.route('/api/courses', methods=['GET'])
 def get_courses():
     """GET all courses with statistics"""
     try:
-        courses = models.get_all_courses()
-        return jsonify({
-            'success': True,
-            'data': courses
-        })
+        return cached_json_response('courses', get_data_version(), models.get_all_courses)
     except Exception as e:
         app.logger.error(f"Error fetching courses: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(e)
 
 @app.route('/api/courses/<int:course_id>', methods=['GET'])
 def get_course(course_id):
@@ -72,31 +123,23 @@ def get_course(course_id):
                 'success': True,
                 'data': course
             })
-        return jsonify({
-            'success': False,
-            'error': 'Course not found'
-        }), 404
+        return error_response('Course not found', 404)
     except Exception as e:
         app.logger.error(f"Error fetching course {course_id}: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(e)
 
 @app.route('/api/courses', methods=['POST'])
 def create_course():
     """POST create new course"""
     try:
         data = request.get_json()
+        if not isinstance(data, dict):
+            return error_response('Expected a JSON object', 400)
         
         # Validate required fields
-        required = ['name', 'code', 'color', 'credits', 'semester']
-        for field in required:
-            if field not in data:
-                return jsonify({
-                    'success': False,
-                    'error': f'Missing required field: {field}'
-                }), 400
+        missing = COURSE_REQUIRED_FIELDS - data.keys()
+        if missing:
+            return error_response(f'Missing required field: {next(iter(missing))}', 400)
         
         course_id = models.create_course(data)
         
@@ -106,10 +149,7 @@ def create_course():
         }), 201
     except Exception as e:
         app.logger.error(f"Error creating course: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(e)
 
 @app.route('/api/courses/<int:course_id>', methods=['PUT'])
 def update_course(course_id):
@@ -124,10 +164,7 @@ def update_course(course_id):
         })
     except Exception as e:
         app.logger.error(f"Error updating course {course_id}: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(e)
 
 @app.route('/api/courses/<int:course_id>', methods=['DELETE'])
 def delete_course(course_id):
@@ -141,17 +178,58 @@ def delete_course(course_id):
         })
     except Exception as e:
         app.logger.error(f"Error deleting course {course_id}: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(e)
 
 # ==================== ASSIGNMENT ENDPOINTS ====================
 
+ASSIGNMENT_REQUIRED_FIELDS = frozenset(('courseId', 'title', 'dueDate', 'priority'))
+ASSIGNMENT_UPDATE_FIELDS = frozenset(('id', 'title', 'dueDate', 'priority'))
+
+def stream_assignments():
+    """
+    Encode the assignment list row by row as it is read from the database
+    Same JSON document as the buffered response, but peak memory stays at
+    one row instead of the whole result set
+    The query runs and the first row is read before the first chunk is
+    yielded, so a caller that takes that chunk sees query errors while it
+    can still send an error response
+    """
+    assignments = models.iter_assignments()
+    try:
+        first = next(assignments, None)
+        
+        yield b'{"success":true,"data":['
+        if first is not None:
+            yield orjson.dumps(first)
+            for assignment in assignments:
+                yield b',' + orjson.dumps(assignment)
+        yield b']}'
+    finally:
+        # Release the cursor now, not at garbage collection, if the client
+        # disconnects mid-stream: an open read statement pins a WAL
+        # snapshot on this thread's connection and blocks its next write
+        assignments.close()
+
+def resume_stream(first_chunk, chunks):
+    """Yield an already-taken first chunk, then the rest of chunks"""
+    try:
+        yield first_chunk
+        yield from chunks
+    finally:
+        chunks.close()
+
 @app.route('/api/assignments', methods=['GET'])
 def get_assignments():
-    """GET all assignments with course info"""
+    """GET all assignments with course info (?stream=1 for a streamed body)"""
     try:
+        if request.args.get('stream') == '1':
+            chunks = stream_assignments()
+            first_chunk = next(chunks)  # Runs the query before the 200 is sent
+            return app.response_class(
+                resume_stream(first_chunk, chunks),
+                mimetype='application/json'
+            )
+        
         assignments = models.get_all_assignments()
         return jsonify({
             'success': True,
@@ -159,10 +237,7 @@ def get_assignments():
         })
     except Exception as e:
         app.logger.error(f"Error fetching assignments: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(e)
 
 @app.route('/api/assignments/<int:assignment_id>', methods=['GET'])
 def get_assignment(assignment_id):
@@ -174,31 +249,23 @@ def get_assignment(assignment_id):
                 'success': True,
                 'data': assignment
             })
-        return jsonify({
-            'success': False,
-            'error': 'Assignment not found'
-        }), 404
+        return error_response('Assignment not found', 404)
     except Exception as e:
         app.logger.error(f"Error fetching assignment {assignment_id}: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(e)
 
 @app.route('/api/assignments', methods=['POST'])
 def create_assignment():
     """POST create new assignment"""
     try:
         data = request.get_json()
+        if not isinstance(data, dict):
+            return error_response('Expected a JSON object', 400)
         
         # Validate required fields
-        required = ['courseId', 'title', 'dueDate', 'priority']
-        for field in required:
-            if field not in data:
-                return jsonify({
-                    'success': False,
-                    'error': f'Missing required field: {field}'
-                }), 400
+        missing = ASSIGNMENT_REQUIRED_FIELDS - data.keys()
+        if missing:
+            return error_response(f'Missing required field: {next(iter(missing))}', 400)
         
         assignment_id = models.create_assignment(data)
         
@@ -208,10 +275,73 @@ def create_assignment():
         }), 201
     except Exception as e:
         app.logger.error(f"Error creating assignment: {str(e)}")
+        return error_response(e)
+
+@app.route('/api/assignments/bulk', methods=['POST'])
+def create_assignments_bulk():
+    """POST create several assignments in one transaction"""
+    try:
+        items = request.get_json()
+        if not isinstance(items, list) or not all(isinstance(data, dict) for data in items):
+            return error_response('Expected a JSON array of assignments', 400)
+        
+        # Validate required fields
+        for data in items:
+            missing = ASSIGNMENT_REQUIRED_FIELDS - data.keys()
+            if missing:
+                return error_response(f'Missing required field: {next(iter(missing))}', 400)
+        
+        assignment_ids = models.create_assignments_bulk(items)
+        
+        return jsonify({
+            'success': True,
+            'data': {'ids': assignment_ids}
+        }), 201
+    except Exception as e:
+        app.logger.error(f"Error creating assignments: {str(e)}")
+        return error_response(e)
+
+@app.route('/api/assignments/bulk', methods=['PUT'])
+def update_assignments_bulk():
+    """PUT update several assignments in one transaction"""
+    try:
+        items = request.get_json()
+        if not isinstance(items, list) or not all(isinstance(data, dict) for data in items):
+            return error_response('Expected a JSON array of assignments', 400)
+        
+        # Validate required fields (courseId is not updatable)
+        for data in items:
+            missing = ASSIGNMENT_UPDATE_FIELDS - data.keys()
+            if missing:
+                return error_response(f'Missing required field: {next(iter(missing))}', 400)
+        
+        models.update_assignments_bulk(items)
+        
         return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+            'success': True,
+            'message': 'Assignments updated successfully'
+        })
+    except Exception as e:
+        app.logger.error(f"Error updating assignments: {str(e)}")
+        return error_response(e)
+
+@app.route('/api/assignments/bulk', methods=['DELETE'])
+def delete_assignments_bulk():
+    """DELETE several assignments in one transaction"""
+    try:
+        ids = request.get_json()
+        if not isinstance(ids, list) or not all(type(assignment_id) is int for assignment_id in ids):
+            return error_response('Expected a JSON array of assignment ids', 400)
+        
+        deleted_ids = models.delete_assignments_bulk(ids)
+        
+        return jsonify({
+            'success': True,
+            'data': {'ids': deleted_ids}
+        })
+    except Exception as e:
+        app.logger.error(f"Error deleting assignments: {str(e)}")
+        return error_response(e)
 
 @app.route('/api/assignments/<int:assignment_id>', methods=['PUT'])
 def update_assignment(assignment_id):
@@ -226,10 +356,7 @@ def update_assignment(assignment_id):
         })
     except Exception as e:
         app.logger.error(f"Error updating assignment {assignment_id}: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(e)
 
 @app.route('/api/assignments/<int:assignment_id>/complete', methods=['PATCH'])
 def toggle_complete(assignment_id):
@@ -242,16 +369,10 @@ def toggle_complete(assignment_id):
                 'success': True,
                 'data': {'completed': bool(new_status)}
             })
-        return jsonify({
-            'success': False,
-            'error': 'Assignment not found'
-        }), 404
+        return error_response('Assignment not found', 404)
     except Exception as e:
         app.logger.error(f"Error toggling assignment {assignment_id}: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(e)
 
 @app.route('/api/assignments/<int:assignment_id>', methods=['DELETE'])
 def delete_assignment(assignment_id):
@@ -265,10 +386,7 @@ def delete_assignment(assignment_id):
         })
     except Exception as e:
         app.logger.error(f"Error deleting assignment {assignment_id}: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(e)
     
 # ==================== SEEDING DATABASE ========================
 
@@ -278,7 +396,7 @@ def seed_database():
         seed_sample_data()  # Existing function
         return jsonify({'success': True, 'message': 'Database seeded with sample data.'})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return error_response(e)
 
 
 # ==================== STATISTICS & REPORTS ====================
@@ -287,17 +405,12 @@ def seed_database():
 def get_stats():
     """GET overall statistics"""
     try:
-        stats = models.get_statistics()
-        return jsonify({
-            'success': True,
-            'data': stats
-        })
+        # Overdue counts depend on the (UTC) date as well as the data
+        version = (get_data_version(), datetime.now(timezone.utc).date())
+        return cached_json_response('stats', version, models.get_statistics)
     except Exception as e:
         app.logger.error(f"Error fetching statistics: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(e)
 
 @app.route('/api/assignments/week', methods=['GET'])
 def get_week_assignments():
@@ -310,58 +423,81 @@ def get_week_assignments():
         })
     except Exception as e:
         app.logger.error(f"Error fetching week assignments: {str(e)}")
+        return error_response(e)
+
+@app.route('/api/dashboard', methods=['GET'])
+def get_dashboard():
+    """GET statistics and assignments due this week in one request"""
+    try:
+        dashboard = models.get_dashboard()
         return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+            'success': True,
+            'data': dashboard
+        })
+    except Exception as e:
+        app.logger.error(f"Error fetching dashboard: {str(e)}")
+        return error_response(e)
 
 # ==================== FRONTEND SERVING ====================
 
+FRONTEND_DIR = os.path.abspath(os.path.join(app.root_path, '..', 'frontend'))
+
 @app.route('/')
 def index():
     """Serve frontend index.html"""
-    return app.send_static_file('index.html')
+    return send_from_directory(FRONTEND_DIR, 'index.html')
+
+@lru_cache(maxsize=256)
+def is_static_file(path):
+    """Check (and remember) whether path is a file in the frontend folder"""
+    full_path = safe_join(FRONTEND_DIR, path)
+    return full_path is not None and os.path.isfile(full_path)
 
 @app.route('/<path:path>')
 def serve_static(path):
     """Serve static files"""
+    # Unknown API paths stay JSON 404s instead of falling back to the SPA
+    if path.startswith('api/'):
+        return error_response('Endpoint not found', 404)
+    
+    # Client-side routes are not files: serve index.html (for SPA routing)
+    # without raising and catching NotFound on every navigation
+    if not is_static_file(path):
+        return send_from_directory(FRONTEND_DIR, 'index.html')
     try:
-        return send_from_directory(app.static_folder, path)
-    except:
-        # If file not found, serve index.html (for SPA routing)
-        return app.send_static_file('index.html')
+        return send_from_directory(FRONTEND_DIR, path)
+    except (NotFound, FileNotFoundError):
+        # Cached lookup is stale (file removed since first request)
+        return send_from_directory(FRONTEND_DIR, 'index.html')
 
 # ==================== ERROR HANDLERS ====================
 
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
-    return jsonify({
-        'success': False,
-        'error': 'Endpoint not found'
-    }), 404
+    return error_response('Endpoint not found', 404)
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
     app.logger.error(f"Internal error: {str(error)}")
-    return jsonify({
-        'success': False,
-        'error': 'Internal server error'
-    }), 500
+    return error_response('Internal server error')
 
 # ==================== APPLICATION STARTUP ====================
 
 if __name__ == '__main__':
-    print("\n" + "=" * 60)
-    print("🚀 ClassTrack Flask API Starting...")
-    print("=" * 60)
-    print(f"📊 Database: {app.config['DATABASE_PATH']}")
-    print(f"🌐 Server: http://{app.config['HOST']}:{app.config['PORT']}")
-    print(f"🔧 Environment: {os.environ.get('FLASK_ENV', 'development')}")
-    print(f"🐛 Debug Mode: {app.config['DEBUG']}")
-    print("=" * 60)
-    print("\nPress CTRL+C to stop\n")
+    app.logger.info(
+        'ClassTrack Flask API starting on http://%s:%s (environment=%s, debug=%s)',
+        app.config['HOST'],
+        app.config['PORT'],
+        os.environ.get('FLASK_ENV', 'development'),
+        app.config['DEBUG']
+    )
+    
+    # Flask's built-in server is for development only; production runs
+    # under gunicorn (see gunicorn.conf.py)
+    if not app.debug:
+        raise SystemExit("Production mode: start the server with 'gunicorn app:app'")
     
     app.run(
         host=app.config['HOST'],
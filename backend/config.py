@@ -8,11 +8,51 @@ ENVIRONMENT SWITCHING:
 The application automatically detects the environment based on FLASK_ENV
 """
 import os
+from functools import lru_cache
 from pathlib import Path
 
 # Get the backend directory path
 BASE_DIR = Path(__file__).parent
 
+def _load_env():
+    """
+    Load KEY=value pairs from the nearest .env file into os.environ
+    Searches the backend directory and its parents. Variables that are
+    already set (e.g. by the hosting platform) are never overridden.
+    """
+    for directory in (BASE_DIR, *BASE_DIR.parents):
+        env_path = directory / '.env'
+        if env_path.is_file():
+            break
+    else:
+        return
+    
+    with open(env_path, encoding='utf-8') as env_file:
+        for line in env_file:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            key, sep, value = line.removeprefix('export ').partition('=')
+            if sep:
+                os.environ.setdefault(key.strip(), value.strip().strip('"\''))
+
+# Load environment variables from .env file (for local development).
+# Must run before the config classes below read os.environ.
+_load_env()
+
+# Placeholder used when SECRET_KEY is not set (never valid in production)
+FALLBACK_SECRET_KEY = 'dev-fallback-DO-NOT-USE-IN-PRODUCTION'
+
+def _require_env_secret():
+    """Read SECRET_KEY from the environment, rejecting missing or fallback keys"""
+    secret = os.environ.get('SECRET_KEY')
+    if not secret or secret == FALLBACK_SECRET_KEY:
+        raise ValueError(
+            "SECRET_KEY must be set in production environment! "
+            "Generate with: python -c \"import secrets; print(secrets.token_hex(32))\""
+        )
+    return secret
+
 class Config:
     """Base configuration with safe defaults"""
     
@@ -20,11 +60,7 @@ class Config:
     # CRITICAL: Must be set via environment variable
     # Local: Set in .env file
     # Production: Set in hosting platform (Render/Railway)
-    SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-fallback-DO-NOT-USE-IN-PRODUCTION'
-    
-    # Warn if using fallback key
-    if SECRET_KEY == 'dev-fallback-DO-NOT-USE-IN-PRODUCTION':
-        print("⚠️  WARNING: Using fallback SECRET_KEY. Set SECRET_KEY in environment!")
+    SECRET_KEY = os.environ.get('SECRET_KEY') or FALLBACK_SECRET_KEY
     
     # ========== DATABASE CONFIGURATION ==========
     DATABASE_NAME = 'classtrack.db'
@@ -35,6 +71,15 @@ class Config:
     # Production: https://class_track_db.onrender.com
     CORS_ORIGINS = os.environ.get('CORS_ORIGINS', 'http://localhost:5000').split(',')
     
+    # ========== RESPONSE COMPRESSION ==========
+    # Brotli (gzip fallback) at level 4: JSON lists shrink several times
+    # over for little CPU; tiny bodies are sent as-is
+    COMPRESS_ALGORITHM = ['br', 'gzip']
+    COMPRESS_ALGORITHM_STREAMING = ['br']
+    COMPRESS_MIN_SIZE = 512
+    COMPRESS_LEVEL = 4
+    COMPRESS_BR_LEVEL = 4
+    
     # ========== FLASK SETTINGS ==========
     DEBUG = False
     TESTING = False
@@ -46,7 +91,9 @@ class Config:
     @staticmethod
     def init_app(app):
         """Initialize application with config-specific settings"""
-        pass
+        # Warn if using fallback key
+        if app.config['SECRET_KEY'] == FALLBACK_SECRET_KEY:
+            app.logger.warning('Using fallback SECRET_KEY. Set SECRET_KEY in environment!')
 
 class DevelopmentConfig(Config):
     """
@@ -66,14 +113,17 @@ class DevelopmentConfig(Config):
     @staticmethod
     def init_app(app):
         """Development-specific initialization"""
-        print("=" * 60)
-        print("🔧 RUNNING IN DEVELOPMENT MODE")
-        print("=" * 60)
-        print(f"📊 Database: {app.config['DATABASE_PATH']}")
-        print(f"🔑 Secret Key: {'SET' if app.config['SECRET_KEY'] != 'dev-fallback-DO-NOT-USE-IN-PRODUCTION' else '⚠️  FALLBACK'}")
-        print(f"🌐 CORS Origins: {app.config['CORS_ORIGINS']}")
-        print(f"🚀 Server: {app.config['HOST']}:{app.config['PORT']}")
-        print("=" * 60)
+        Config.init_app(app)
+        
+        app.logger.info(
+            'ClassTrack running in development mode '
+            '(database=%s, secret_key=%s, cors_origins=%s, server=%s:%s)',
+            app.config['DATABASE_PATH'],
+            'set' if app.config['SECRET_KEY'] != FALLBACK_SECRET_KEY else 'FALLBACK',
+            app.config['CORS_ORIGINS'],
+            app.config['HOST'],
+            app.config['PORT']
+        )
 
 class ProductionConfig(Config):
     """
@@ -84,20 +134,13 @@ class ProductionConfig(Config):
     """
     DEBUG = False
     
-    # Enforce environment variables in production
-    @property
-    def SECRET_KEY(self):
-        secret = os.environ.get('SECRET_KEY')
-        if not secret or secret == 'dev-fallback-DO-NOT-USE-IN-PRODUCTION':
-            raise ValueError(
-                "SECRET_KEY must be set in production environment! "
-                "Generate with: python -c \"import secrets; print(secrets.token_hex(32))\""
-            )
-        return secret
-    
     @staticmethod
     def init_app(app):
         """Production-specific initialization"""
+        # Enforce environment variables in production (resolved once at
+        # startup rather than on every config access)
+        app.config['SECRET_KEY'] = _require_env_secret()
+        
         import logging
         from logging.handlers import RotatingFileHandler
         
@@ -107,16 +150,13 @@ class ProductionConfig(Config):
         app.logger.addHandler(stream_handler)
         app.logger.setLevel(logging.INFO)
         
-        print("=" * 60)
-        print("🚀 RUNNING IN PRODUCTION MODE")
-        print("=" * 60)
-        print(f"📊 Database: {app.config['DATABASE_PATH']}")
-        print(f"🔑 Secret Key: SET")
-        print(f"🌐 CORS Origins: {app.config['CORS_ORIGINS']}")
-        print(f"🔒 Debug: {app.config['DEBUG']}")
-        print("=" * 60)
-        
-        app.logger.info('ClassTrack production startup complete')
+        app.logger.info(
+            'ClassTrack production startup complete '
+            '(database=%s, cors_origins=%s, debug=%s)',
+            app.config['DATABASE_PATH'],
+            app.config['CORS_ORIGINS'],
+            app.config['DEBUG']
+        )
 
 # Configuration dictionary
 config = {
@@ -125,6 +165,7 @@ config = {
     'default': DevelopmentConfig
 }
 
+@lru_cache(maxsize=1)
 def get_config():
     """
     Get configuration based on FLASK_ENV environment variable
@@ -132,6 +173,8 @@ def get_config():
     Returns appropriate config class based on environment:
     - development: DevelopmentConfig (default)
     - production: ProductionConfig
+    
+    Resolved once per process; FLASK_ENV is not re-read afterwards.
     """
     env = os.environ.get('FLASK_ENV', 'development')
     return config.get(env, config['default'])
@@ -1,120 +1,267 @@
+import os
 import sqlite3
-from pathlib import Path
-from datetime import datetime
+import threading
+from contextlib import closing, contextmanager
 from config import Config
 
-def get_db_connection():
-    conn = sqlite3.connect(Config.DATABASE_PATH, timeout=10)
+# Per-connection settings: NORMAL sync is safe under WAL, and the page
+# cache (64 MB) plus mmap window (256 MB) hold the whole database, so
+# reads are served from memory instead of read() syscalls
+CONNECTION_PRAGMAS = (
+    'PRAGMA foreign_keys = ON',
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA cache_size = -64000',
+    'PRAGMA mmap_size = 268435456',
+    'PRAGMA temp_store = MEMORY',
+)
+
+# One long-lived connection per thread, so SQLite's page cache and
+# prepared-statement cache survive from one request to the next
+_local = threading.local()
+
+def _connect():
+    # isolation_level=None: autocommit, no implicit BEGIN before writes;
+    # writers open their own transaction with transaction()
+    conn = sqlite3.connect(
+        Config.DATABASE_PATH,
+        timeout=10,
+        check_same_thread=False,
+        isolation_level=None
+    )
     conn.row_factory = sqlite3.Row  # Access columns by name
-    conn.execute('PRAGMA foreign_keys = ON')
-    conn.execute('PRAGMA journal_mode=WAL')
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+def get_db_connection():
+    """
+    Return this thread's database connection
+    Opened on first use and kept open for the life of the thread
+    """
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = _local.conn = _connect()
     return conn
 
+@contextmanager
+def transaction():
+    """
+    Run a block of writes as one transaction on this thread's connection
+    BEGIN IMMEDIATE takes the write lock up front; the block commits on
+    success and rolls back if it raises
+    """
+    conn = get_db_connection()
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        # Also covers a failed COMMIT, which would otherwise leave the
+        # transaction open on this thread's long-lived connection
+        conn.rollback()
+        raise
+
+@contextmanager
+def read_transaction():
+    """
+    Run a block of reads against one snapshot on this thread's connection
+    Under WAL, a plain BEGIN pins the snapshot at the first read, so every
+    query in the block sees the same data
+    """
+    conn = get_db_connection()
+    conn.execute('BEGIN')
+    try:
+        yield conn
+    finally:
+        conn.commit()
+
+# Connection used only to read PRAGMA data_version, which changes whenever
+# any other connection (in this or another worker process) commits
+_version_conn = None
+_version_lock = threading.Lock()
+
+def get_data_version():
+    """
+    Return a counter that changes whenever the database is written to
+    Lets callers cache data derived from the database and notice writes
+    made by any worker
+    """
+    global _version_conn
+    with _version_lock:
+        if _version_conn is None:
+            _version_conn = sqlite3.connect(Config.DATABASE_PATH, check_same_thread=False)
+        return _version_conn.execute('PRAGMA data_version').fetchone()[0]
+
+def _reset_after_fork():
+    # SQLite connections must not be shared across fork(); a forked
+    # worker opens its own on first use
+    global _local, _version_conn
+    _local = threading.local()
+    _version_conn = None
+
+# Unix only; there is no fork() to guard against on Windows
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+# Full schema, applied in one executescript() call and one transaction.
+# page_size only applies before the first table exists, and WAL is
+# persistent in the database file, so both are set once here instead
+# of on every connection (neither may run inside a transaction)
+SCHEMA_SQL = '''
+PRAGMA page_size = 4096;
+PRAGMA journal_mode = WAL;
+
+BEGIN;
+
+-- Courses table
+CREATE TABLE IF NOT EXISTS courses (
+    course_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    course_name TEXT NOT NULL,
+    course_code TEXT NOT NULL UNIQUE,
+    color TEXT NOT NULL,
+    credits INTEGER NOT NULL,
+    semester TEXT NOT NULL,
+    archived INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Assignments table
+CREATE TABLE IF NOT EXISTS assignments (
+    assignment_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    course_id INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT,
+    due_date DATE NOT NULL,
+    priority TEXT CHECK(priority IN ('low', 'medium', 'high')) NOT NULL,
+    points INTEGER DEFAULT 0,
+    completed INTEGER DEFAULT 0,
+    completed_date TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (course_id) REFERENCES courses(course_id) ON DELETE CASCADE
+);
+
+-- Assignment History table (audit trail)
+-- No foreign key to assignments: history rows outlive the assignment
+-- they describe, including the row logging its deletion
+CREATE TABLE IF NOT EXISTS assignment_history (
+    history_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    assignment_id INTEGER NOT NULL,
+    action TEXT NOT NULL,
+    action_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    old_value TEXT,
+    new_value TEXT
+);
+
+-- Indexes for the hot lookups: assignments by course (covers the
+-- per-course completion counts), open assignments by due date (partial
+-- index for the this week view) and history by assignment
+DROP INDEX IF EXISTS idx_assignments_course;
+DROP INDEX IF EXISTS idx_assignments_completed;
+CREATE INDEX IF NOT EXISTS idx_assignments_course_completed ON assignments(course_id, completed);
+CREATE INDEX IF NOT EXISTS idx_assignments_due ON assignments(due_date) WHERE completed = 0;
+CREATE INDEX IF NOT EXISTS idx_history_assignment ON assignment_history(assignment_id);
+
+COMMIT;
+'''
+
+# Rebuilds an assignment_history table created with the old foreign key
+# to assignments (SQLite cannot drop a constraint in place), keeping its
+# rows and ids
+HISTORY_MIGRATION_SQL = '''
+BEGIN;
+
+CREATE TABLE assignment_history_new (
+    history_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    assignment_id INTEGER NOT NULL,
+    action TEXT NOT NULL,
+    action_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    old_value TEXT,
+    new_value TEXT
+);
+
+INSERT INTO assignment_history_new
+SELECT history_id, assignment_id, action, action_date, old_value, new_value
+FROM assignment_history;
+
+DROP TABLE assignment_history;
+ALTER TABLE assignment_history_new RENAME TO assignment_history;
+CREATE INDEX IF NOT EXISTS idx_history_assignment ON assignment_history(assignment_id);
+
+COMMIT;
+'''
+
 def init_database():
     """
     Initialize database with required tables
     Creates: courses, assignments, assignment_history
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Create Courses table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS courses (
-        course_id INTEGER PRIMARY KEY AUTOINCREMENT,
-        course_name TEXT NOT NULL,
-        course_code TEXT NOT NULL UNIQUE,
-        color TEXT NOT NULL,
-        credits INTEGER NOT NULL,
-        semester TEXT NOT NULL,
-        archived INTEGER DEFAULT 0,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    )
-    ''')
-    
-    # Create Assignments table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS assignments (
-        assignment_id INTEGER PRIMARY KEY AUTOINCREMENT,
-        course_id INTEGER NOT NULL,
-        title TEXT NOT NULL,
-        description TEXT,
-        due_date DATE NOT NULL,
-        priority TEXT CHECK(priority IN ('low', 'medium', 'high')) NOT NULL,
-        points INTEGER DEFAULT 0,
-        completed INTEGER DEFAULT 0,
-        completed_date TIMESTAMP,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (course_id) REFERENCES courses(course_id) ON DELETE CASCADE
-    )
-    ''')
-    
-    # Create Assignment History table (audit trail)
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS assignment_history (
-        history_id INTEGER PRIMARY KEY AUTOINCREMENT,
-        assignment_id INTEGER NOT NULL,
-        action TEXT NOT NULL,
-        action_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        old_value TEXT,
-        new_value TEXT,
-        FOREIGN KEY (assignment_id) REFERENCES assignments(assignment_id)
-    )
-    ''')
-    
-    conn.commit()
-    conn.close()
-    
-    print(f"✅ Database initialized at: {Config.DATABASE_PATH}")
+    # Short-lived connection: the importing thread serves no requests, so
+    # it should not keep a per-thread connection open
+    with closing(_connect()) as conn:
+        conn.executescript(SCHEMA_SQL)
+        
+        if conn.execute('PRAGMA foreign_key_list(assignment_history)').fetchone():
+            conn.executescript(HISTORY_MIGRATION_SQL)
+
+def analyze_database():
+    """
+    Refresh query planner statistics (sqlite_stat1) at startup
+    analysis_limit caps the rows ANALYZE samples per index, so this stays
+    fast as the tables grow while keeping the statistics current
+    """
+    with closing(_connect()) as conn:
+        conn.execute('PRAGMA analysis_limit = 400')
+        conn.execute('ANALYZE')
+
+# Sample data for seed_sample_data()
+# (course_name, course_code, color, credits, semester)
+SAMPLE_COURSES = (
+    ('Applied Programming', 'CSE 310', '#0062B8', 3, 'Fall 2025'),
+    ('Personal Health', 'PUBH 132', '#28A745', 2, 'Fall 2025'),
+    ('Statistics', 'MATH 221', '#FFB81C', 3, 'Fall 2025')
+)
+
+# (course_id, title, description, due_date, priority, points, completed, completed_date)
+SAMPLE_ASSIGNMENTS = (
+    (1, 'JavaScript Module', 'Build task manager with localStorage', '2025-11-22', 'high', 100, 1, '2025-11-08 15:30:00'),
+    (1, 'Python Flask Backend', 'Implement REST API with SQLite', '2025-11-22', 'high', 100, 0, None),
+    (2, 'Weekly Fitness Log', 'Track 150 minutes of activity', '2025-11-24', 'medium', 50, 0, None),
+    (3, 'Probability Homework', 'Complete chapter 5 problems', '2025-11-20', 'medium', 75, 0, None)
+)
 
 def seed_sample_data():
     """
     Insert sample data for testing
     Only runs if database is empty
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Check if data already exists
-    cursor.execute('SELECT COUNT(*) FROM courses')
-    if cursor.fetchone()[0] > 0:
-        print("ℹ️  Database already contains data. Skipping seed.")
-        conn.close()
-        return
-    
-    # Insert sample courses
-    sample_courses = [
-        ('Applied Programming', 'CSE 310', '#0062B8', 3, 'Fall 2025'),
-        ('Personal Health', 'PUBH 132', '#28A745', 2, 'Fall 2025'),
-        ('Statistics', 'MATH 221', '#FFB81C', 3, 'Fall 2025')
-    ]
-    
-    cursor.executemany('''
-    INSERT INTO courses (course_name, course_code, color, credits, semester)
-    VALUES (?, ?, ?, ?, ?)
-    ''', sample_courses)
-    
-    # Insert sample assignments
-    sample_assignments = [
-        (1, 'JavaScript Module', 'Build task manager with localStorage', '2025-11-22', 'high', 100, 1, '2025-11-08 15:30:00'),
-        (1, 'Python Flask Backend', 'Implement REST API with SQLite', '2025-11-22', 'high', 100, 0, None),
-        (2, 'Weekly Fitness Log', 'Track 150 minutes of activity', '2025-11-24', 'medium', 50, 0, None),
-        (3, 'Probability Homework', 'Complete chapter 5 problems', '2025-11-20', 'medium', 75, 0, None)
-    ]
-    
-    cursor.executemany('''
-    INSERT INTO assignments (course_id, title, description, due_date, priority, points, completed, completed_date)
-    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    ''', sample_assignments)
-    
-    conn.commit()
-    conn.close()
+    # One write transaction covers the emptiness check and both inserts:
+    # a single commit, and concurrent seeds cannot both see an empty table
+    with transaction() as conn:
+        cursor = conn.cursor()
+        
+        # Check if data already exists
+        cursor.execute('SELECT 1 FROM courses LIMIT 1')
+        if cursor.fetchone() is not None:
+            print("ℹ️  Database already contains data. Skipping seed.")
+            return
+        
+        # Insert sample courses
+        cursor.executemany('''
+        INSERT INTO courses (course_name, course_code, color, credits, semester)
+        VALUES (?, ?, ?, ?, ?)
+        ''', SAMPLE_COURSES)
+        
+        # Insert sample assignments
+        cursor.executemany('''
+        INSERT INTO assignments (course_id, title, description, due_date, priority, points, completed, completed_date)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', SAMPLE_ASSIGNMENTS)
     
     print("✅ Sample data inserted successfully")
 
 if __name__ == '__main__':
     # Run this file directly to initialize database
-    print("Initializing ClassTrack database...")
+    print(f"Initializing ClassTrack database at {Config.DATABASE_PATH}...")
     init_database()
     seed_sample_data()
     print("Database setup complete!")
@@ -0,0 +1,16 @@
+"""
+Gunicorn settings for the ClassTrack production server
+
+Usage (from the backend directory):
+    gunicorn app:app
+
+Threaded workers: sqlite3 releases the GIL while SQLite runs a query,
+so requests in one worker overlap on database I/O; several workers
+spread the Python work across cores.
+"""
+import os
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 4))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
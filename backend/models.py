@@ -1,139 +1,185 @@
-from database import get_db_connection
-from datetime import datetime
+from database import get_db_connection, get_data_version, read_transaction, transaction
+from functools import wraps
+import json
+import time
+
+# ==================== READ CACHE ====================
+
+# Results of the aggregate reads, keyed by (function name, args)
+# Each entry is (data_version, expires_at, result)
+read_cache = {}
+
+def ttl_cache(seconds):
+    """
+    Cache a read-only function's result for a few seconds
+    Entries are tied to the database data version, so a write from any
+    worker invalidates them at once; the TTL bounds how long results that
+    depend on today's date (due this week) can lag
+    Only for reads not already behind app.py's response cache, which is
+    keyed on the same data version
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args):
+            key = (func.__name__, args)
+            version = get_data_version()
+            now = time.monotonic()
+            cached = read_cache.get(key)
+            if cached is not None and cached[0] == version and cached[1] > now:
+                return cached[2]
+            
+            result = func(*args)
+            read_cache[key] = (version, now + seconds, result)
+            return result
+        return wrapper
+    return decorator
+
+# Every statement is a module-level SQL_* constant. sqlite3 keeps a cache
+# of prepared statements per connection, keyed on the SQL text, and each
+# thread keeps its connection open, so each statement is compiled once
+# per thread and reused by every later call
 
 # ==================== COURSE OPERATIONS ====================
 
+# Output keys for get_all_courses(), in the order of its SELECT columns
+COURSE_LIST_KEYS = (
+    'id', 'name', 'code', 'color', 'credits', 'semester',
+    'totalAssignments', 'completedAssignments', 'progress'
+)
+
+SQL_GET_ALL_COURSES = '''
+WITH agg AS (
+    SELECT 
+        course_id,
+        COUNT(*) as total,
+        SUM(CASE WHEN completed = 1 THEN 1 ELSE 0 END) as done
+    FROM assignments
+    GROUP BY course_id
+)
+SELECT 
+    c.course_id,
+    c.course_name,
+    c.course_code,
+    c.color,
+    c.credits,
+    c.semester,
+    COALESCE(agg.total, 0) as total_assignments,
+    COALESCE(agg.done, 0) as completed_assignments,
+    CASE WHEN agg.total > 0 THEN ROUND(100.0 * agg.done / agg.total, 1) ELSE 0 END as progress
+FROM courses c
+LEFT JOIN agg ON c.course_id = agg.course_id
+WHERE c.archived = 0
+ORDER BY c.course_name
+'''
+
 def get_all_courses():
     """
     Retrieve all courses with assignment counts and completion stats
-    Uses LEFT JOIN to include courses without assignments
+    Assignments are aggregated once per course in a CTE (read straight
+    from the course/completed index), then LEFT JOINed so courses without
+    assignments are included; progress is computed in SQL
     """
     conn = get_db_connection()
     cursor = conn.cursor()
     
-    sql = '''
-    SELECT 
-        c.course_id,
-        c.course_name,
-        c.course_code,
-        c.color,
-        c.credits,
-        c.semester,
-        c.archived,
-        COUNT(a.assignment_id) as total_assignments,
-        SUM(CASE WHEN a.completed = 1 THEN 1 ELSE 0 END) as completed_assignments
-    FROM courses c
-    LEFT JOIN assignments a ON c.course_id = a.course_id
-    WHERE c.archived = 0
-    GROUP BY c.course_id
-    ORDER BY c.course_name
-    '''
+    cursor.execute(SQL_GET_ALL_COURSES)
     
-    cursor.execute(sql)
-    rows = cursor.fetchall()
-    conn.commit()
-    conn.close()
-    
-    courses = []
-    for row in rows:
-        total = row['total_assignments']
-        completed = row['completed_assignments'] or 0
-        progress = (completed / total * 100) if total > 0 else 0
-        
-        courses.append({
-            'id': row['course_id'],
-            'name': row['course_name'],
-            'code': row['course_code'],
-            'color': row['color'],
-            'credits': row['credits'],
-            'semester': row['semester'],
-            'totalAssignments': total,
-            'completedAssignments': completed,
-            'progress': round(progress, 1)
-        })
-    
-    return courses
+    # Built straight from the cursor, without a fetchall() list in between
+    return [dict(zip(COURSE_LIST_KEYS, row)) for row in cursor]
+
+def row_to_course(row):
+    """Build the API representation of a courses row"""
+    return {
+        'id': row['course_id'],
+        'name': row['course_name'],
+        'code': row['course_code'],
+        'color': row['color'],
+        'credits': row['credits'],
+        'semester': row['semester']
+    }
+
+SQL_GET_COURSE = 'SELECT * FROM courses WHERE course_id = ?'
 
 def get_course_by_id(course_id):
     """Get single course by ID"""
     conn = get_db_connection()
     cursor = conn.cursor()
     
-    cursor.execute('SELECT * FROM courses WHERE course_id = ?', (course_id,))
+    cursor.execute(SQL_GET_COURSE, (course_id,))
     row = cursor.fetchone()
-    conn.commit()
-    conn.close()
     
     if row:
-        return {
-            'id': row['course_id'],
-            'name': row['course_name'],
-            'code': row['course_code'],
-            'color': row['color'],
-            'credits': row['credits'],
-            'semester': row['semester']
-        }
+        return row_to_course(row)
     return None
 
+# Batch lookups pass their ids as one JSON array parameter, so the SQL
+# text (and its cached prepared statement) is the same for any batch size
+# and there is no limit on the number of bound variables
+SQL_GET_COURSES_BY_IDS = '''
+SELECT * FROM courses
+WHERE course_id IN (SELECT value FROM json_each(?))
+'''
+
+def get_courses_by_ids(course_ids):
+    """
+    Get several courses in one query
+    Use instead of calling get_course_by_id() in a loop; returns a dict
+    keyed by course id, without entries for ids that do not exist
+    """
+    course_ids = list(course_ids)
+    if not course_ids:
+        return {}
+    
+    conn = get_db_connection()
+    rows = conn.execute(SQL_GET_COURSES_BY_IDS, (json.dumps(course_ids),))
+    
+    return {row['course_id']: row_to_course(row) for row in rows}
+
+SQL_CREATE_COURSE = '''
+INSERT INTO courses (course_name, course_code, color, credits, semester)
+VALUES (?, ?, ?, ?, ?)
+'''
+
 def create_course(data):
     """
     Insert new course into database
     Returns the new course_id
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    sql = '''
-    INSERT INTO courses (course_name, course_code, color, credits, semester)
-    VALUES (?, ?, ?, ?, ?)
-    '''
-    
-    cursor.execute(sql, (
-        data['name'],
-        data['code'],
-        data['color'],
-        data['credits'],
-        data['semester']
-    ))
-    
-    conn.commit()
-    course_id = cursor.lastrowid
-    conn.close()
-    
-    return course_id
+    with transaction() as conn:
+        cursor = conn.execute(SQL_CREATE_COURSE, (
+            data['name'],
+            data['code'],
+            data['color'],
+            data['credits'],
+            data['semester']
+        ))
+    
+    return cursor.lastrowid
+
+SQL_UPDATE_COURSE = '''
+UPDATE courses 
+SET course_name = ?, course_code = ?, color = ?, credits = ?, semester = ?
+WHERE course_id = ?
+'''
 
 def update_course(course_id, data):
     """Update existing course"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    sql = '''
-    UPDATE courses 
-    SET course_name = ?, course_code = ?, color = ?, credits = ?, semester = ?
-    WHERE course_id = ?
-    '''
-    
-    cursor.execute(sql, (
-        data['name'],
-        data['code'],
-        data['color'],
-        data['credits'],
-        data['semester'],
-        course_id
-    ))
-    
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        conn.execute(SQL_UPDATE_COURSE, (
+            data['name'],
+            data['code'],
+            data['color'],
+            data['credits'],
+            data['semester'],
+            course_id
+        ))
+
+SQL_DELETE_COURSE = 'DELETE FROM courses WHERE course_id = ?'
 
 def delete_course(course_id):
     """Delete course (cascades to assignments)"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('DELETE FROM courses WHERE course_id = ?', (course_id,))
-    
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        conn.execute(SQL_DELETE_COURSE, (course_id,))
 
 # ==================== ASSIGNMENT OPERATIONS ====================
 
@@ -142,61 +188,68 @@ def get_all_assignments():
     Retrieve all assignments with course information
     Uses INNER JOIN to include course details
     """
+    return list(iter_assignments())
+
+SQL_GET_ALL_ASSIGNMENTS = '''
+SELECT 
+    a.assignment_id,
+    a.course_id,
+    a.title,
+    a.description,
+    a.due_date,
+    a.priority,
+    a.points,
+    a.completed,
+    a.completed_date,
+    c.course_name,
+    c.course_code,
+    c.color
+FROM assignments a
+INNER JOIN courses c ON a.course_id = c.course_id
+ORDER BY a.due_date ASC
+'''
+
+def iter_assignments():
+    """
+    Yield assignments with course information one row at a time
+    Reads the cursor directly instead of fetchall(), so callers that
+    stream the result never hold the whole table in memory
+    """
     conn = get_db_connection()
     cursor = conn.cursor()
     
-    sql = '''
-    SELECT 
-        a.assignment_id,
-        a.course_id,
-        a.title,
-        a.description,
-        a.due_date,
-        a.priority,
-        a.points,
-        a.completed,
-        a.completed_date,
-        c.course_name,
-        c.course_code,
-        c.color
-    FROM assignments a
-    INNER JOIN courses c ON a.course_id = c.course_id
-    ORDER BY a.due_date ASC
-    '''
-    
-    cursor.execute(sql)
-    rows = cursor.fetchall()
-    conn.commit()
-    conn.close()
-    
-    assignments = []
-    for row in rows:
-        assignments.append({
-            'id': row['assignment_id'],
-            'courseId': row['course_id'],
-            'title': row['title'],
-            'description': row['description'],
-            'dueDate': row['due_date'],
-            'priority': row['priority'],
-            'points': row['points'],
-            'completed': bool(row['completed']),
-            'completedDate': row['completed_date'],
-            'courseName': row['course_name'],
-            'courseCode': row['course_code'],
-            'courseColor': row['color']
-        })
-    
-    return assignments
+    cursor.execute(SQL_GET_ALL_ASSIGNMENTS)
+    
+    # Rows are unpacked by position, which is faster than zip() or lookups
+    # by name; the names must stay in SQL_GET_ALL_ASSIGNMENTS column order.
+    # completed is passed through as 0/1; the frontend only tests truthiness
+    for (assignment_id, course_id, title, description, due_date, priority,
+         points, completed, completed_date, course_name, course_code,
+         color) in cursor:
+        yield {
+            'id': assignment_id,
+            'courseId': course_id,
+            'title': title,
+            'description': description,
+            'dueDate': due_date,
+            'priority': priority,
+            'points': points,
+            'completed': completed,
+            'completedDate': completed_date,
+            'courseName': course_name,
+            'courseCode': course_code,
+            'courseColor': color
+        }
+
+SQL_GET_ASSIGNMENT = 'SELECT * FROM assignments WHERE assignment_id = ?'
 
 def get_assignment_by_id(assignment_id):
     """Get single assignment by ID"""
     conn = get_db_connection()
     cursor = conn.cursor()
     
-    cursor.execute('SELECT * FROM assignments WHERE assignment_id = ?', (assignment_id,))
+    cursor.execute(SQL_GET_ASSIGNMENT, (assignment_id,))
     row = cursor.fetchone()
-    conn.commit()
-    conn.close()
     
     if row:
         return {
@@ -213,138 +266,203 @@ def get_assignment_by_id(assignment_id):
 
 def create_assignment(data):
     """Insert new assignment"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    sql = '''
-    INSERT INTO assignments (course_id, title, description, due_date, priority, points)
-    VALUES (?, ?, ?, ?, ?, ?)
-    '''
-    
-    cursor.execute(sql, (
-        data['courseId'],
-        data['title'],
-        data.get('description', ''),
-        data['dueDate'],
-        data['priority'],
-        data.get('points', 0)
-    ))
-    
-    assignment_id = cursor.lastrowid
-    
-    # Log to history
-    cursor.execute('''
-    INSERT INTO assignment_history (assignment_id, action, new_value)
-    VALUES (?, 'created', ?)
-    ''', (assignment_id, data['title']))
-    
-    conn.commit()
-    conn.close()
+    return create_assignments_bulk([data])[0]
+
+SQL_CREATE_ASSIGNMENT = '''
+INSERT INTO assignments (course_id, title, description, due_date, priority, points)
+VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+SQL_LAST_INSERT_ID = 'SELECT last_insert_rowid()'
+
+SQL_LOG_CREATED = '''
+INSERT INTO assignment_history (assignment_id, action, new_value)
+VALUES (?, 'created', ?)
+'''
+
+def create_assignments_bulk(items):
+    """
+    Insert several assignments and their history rows in one transaction
+    Returns the new assignment_ids in the order given
+    """
+    rows = [
+        (
+            data['courseId'],
+            data['title'],
+            data.get('description', ''),
+            data['dueDate'],
+            data['priority'],
+            data.get('points', 0)
+        )
+        for data in items
+    ]
+    if not rows:
+        return []
+    
+    with transaction() as conn:
+        conn.executemany(SQL_CREATE_ASSIGNMENT, rows)
+        
+        # AUTOINCREMENT ids are handed out consecutively while this
+        # transaction holds the write lock, so the last id gives them all
+        last_id = conn.execute(SQL_LAST_INSERT_ID).fetchone()[0]
+        assignment_ids = list(range(last_id - len(rows) + 1, last_id + 1))
+        
+        # Log to history
+        conn.executemany(SQL_LOG_CREATED, zip(assignment_ids, (data['title'] for data in items)))
     
-    return assignment_id
+    return assignment_ids
+
+SQL_UPDATE_ASSIGNMENT = '''
+UPDATE assignments 
+SET title = ?, description = ?, due_date = ?, priority = ?, points = ?
+WHERE assignment_id = ?
+'''
 
 def update_assignment(assignment_id, data):
     """Update existing assignment"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    sql = '''
-    UPDATE assignments 
-    SET title = ?, description = ?, due_date = ?, priority = ?, points = ?
-    WHERE assignment_id = ?
-    '''
-    
-    cursor.execute(sql, (
-        data['title'],
-        data.get('description', ''),
-        data['dueDate'],
-        data['priority'],
-        data.get('points', 0),
-        assignment_id
-    ))
-    
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        conn.execute(SQL_UPDATE_ASSIGNMENT, (
+            data['title'],
+            data.get('description', ''),
+            data['dueDate'],
+            data['priority'],
+            data.get('points', 0),
+            assignment_id
+        ))
+
+def update_assignments_bulk(items):
+    """
+    Update several assignments in one transaction
+    Each item carries its assignment 'id' alongside the updated fields
+    """
+    rows = [
+        (
+            data['title'],
+            data.get('description', ''),
+            data['dueDate'],
+            data['priority'],
+            data.get('points', 0),
+            data['id']
+        )
+        for data in items
+    ]
+    if not rows:
+        return
+    
+    with transaction() as conn:
+        conn.executemany(SQL_UPDATE_ASSIGNMENT, rows)
+
+SQL_TOGGLE_ASSIGNMENT = '''
+UPDATE assignments 
+SET completed = 1 - completed,
+    completed_date = CASE WHEN completed = 0
+        THEN strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+        ELSE NULL END
+WHERE assignment_id = ?
+RETURNING completed
+'''
+
+SQL_LOG_ACTION = '''
+INSERT INTO assignment_history (assignment_id, action)
+VALUES (?, ?)
+'''
 
 def toggle_assignment_complete(assignment_id):
-    """Toggle assignment completion status"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Get current status
-    cursor.execute('SELECT completed FROM assignments WHERE assignment_id = ?', (assignment_id,))
-    current = cursor.fetchone()
-    
-    if current:
-        new_status = 0 if current['completed'] else 1
-        completed_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S') if new_status else None
+    """
+    Toggle assignment completion status
+    Flips the flag in a single UPDATE (SET expressions see the old row),
+    so there is no separate read and no window between read and write
+    """
+    with transaction() as conn:
+        cursor = conn.cursor()
+        
+        cursor.execute(SQL_TOGGLE_ASSIGNMENT, (assignment_id,))
+        row = cursor.fetchone()
         
-        cursor.execute('''
-        UPDATE assignments 
-        SET completed = ?, completed_date = ?
-        WHERE assignment_id = ?
-        ''', (new_status, completed_date, assignment_id))
+        if row is None:
+            return None
+        new_status = row['completed']
         
         # Log to history
         action = 'completed' if new_status else 'uncompleted'
-        cursor.execute('''
-        INSERT INTO assignment_history (assignment_id, action)
-        VALUES (?, ?)
-        ''', (assignment_id, action))
-        
-        conn.commit()
+        cursor.execute(SQL_LOG_ACTION, (assignment_id, action))
     
-    conn.close()
-    return new_status if current else None
+    return new_status
+
+SQL_DELETE_ASSIGNMENT = 'DELETE FROM assignments WHERE assignment_id = ? RETURNING title'
+
+SQL_LOG_DELETED = '''
+INSERT INTO assignment_history (assignment_id, action, old_value)
+VALUES (?, 'deleted', ?)
+'''
 
 def delete_assignment(assignment_id):
-    """Delete assignment"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Get title for history
-    cursor.execute('SELECT title FROM assignments WHERE assignment_id = ?', (assignment_id,))
-    row = cursor.fetchone()
-    
-    if row:
-        # Log deletion
-        cursor.execute('''
-        INSERT INTO assignment_history (assignment_id, action, old_value)
-        VALUES (?, 'deleted', ?)
-        ''', (assignment_id, row['title']))
+    """
+    Delete assignment
+    The DELETE returns the title for the history row, so no separate
+    SELECT is needed beforehand
+    """
+    with transaction() as conn:
+        cursor = conn.cursor()
         
-        # Delete assignment
-        cursor.execute('DELETE FROM assignments WHERE assignment_id = ?', (assignment_id,))
+        cursor.execute(SQL_DELETE_ASSIGNMENT, (assignment_id,))
+        row = cursor.fetchone()
+        
+        if row:
+            # Log deletion
+            cursor.execute(SQL_LOG_DELETED, (assignment_id, row['title']))
+
+SQL_DELETE_ASSIGNMENTS = '''
+DELETE FROM assignments
+WHERE assignment_id IN (SELECT value FROM json_each(?))
+RETURNING assignment_id, title
+'''
+
+def delete_assignments_bulk(ids):
+    """
+    Delete several assignments in one transaction
+    One DELETE ... RETURNING removes them all and returns the titles for
+    the history rows, which go in with executemany()
+    Returns the ids that existed and were deleted
+    """
+    ids = list(ids)
+    if not ids:
+        return []
+    
+    with transaction() as conn:
+        rows = conn.execute(SQL_DELETE_ASSIGNMENTS, (json.dumps(ids),)).fetchall()
         
-        conn.commit()
+        # Log deletions
+        conn.executemany(SQL_LOG_DELETED, rows)
     
-    conn.close()
+    return [row['assignment_id'] for row in rows]
 
 # ==================== STATISTICS & REPORTS ====================
 
+SQL_GET_STATISTICS = '''
+SELECT 
+    COUNT(*) as total,
+    SUM(CASE WHEN completed = 1 THEN 1 ELSE 0 END) as completed,
+    SUM(CASE WHEN completed = 0 AND due_date < DATE('now') THEN 1 ELSE 0 END) as overdue,
+    SUM(points) as total_points,
+    SUM(CASE WHEN completed = 1 THEN points ELSE 0 END) as earned_points,
+    AVG(CASE WHEN completed = 1 THEN points ELSE NULL END) as avg_completed_points
+FROM assignments
+'''
+
 def get_statistics():
     """
     Calculate overall statistics using aggregate functions
     Demonstrates SUM, COUNT, AVG
     """
-    conn = get_db_connection()
+    return read_statistics(get_db_connection())
+
+def read_statistics(conn):
+    """Run the statistics query on conn"""
     cursor = conn.cursor()
     
-    sql = '''
-    SELECT 
-        COUNT(*) as total,
-        SUM(CASE WHEN completed = 1 THEN 1 ELSE 0 END) as completed,
-        SUM(CASE WHEN completed = 0 AND due_date < DATE('now') THEN 1 ELSE 0 END) as overdue,
-        SUM(points) as total_points,
-        SUM(CASE WHEN completed = 1 THEN points ELSE 0 END) as earned_points,
-        AVG(CASE WHEN completed = 1 THEN points ELSE NULL END) as avg_completed_points
-    FROM assignments
-    '''
-    
-    cursor.execute(sql)
+    cursor.execute(SQL_GET_STATISTICS)
     result = cursor.fetchone()
-    conn.commit()
-    conn.close()
     
     total = result['total'] or 0
     completed = result['completed'] or 0
@@ -360,48 +478,69 @@ def get_statistics():
         'avgCompletedPoints': round(result['avg_completed_points'] or 0, 2)
     }
 
+# due_date holds ISO 'YYYY-MM-DD' text (what <input type="date"> sends), so
+# the bounds compare as plain strings and the planner answers the WHERE
+# clause with a range search on the partial idx_assignments_due index.
+# Keep functions of due_date (JULIANDAY) in the SELECT list only: wrapped
+# in the WHERE clause they would force a scan
+SQL_GET_ASSIGNMENTS_DUE_THIS_WEEK = '''
+SELECT 
+    a.assignment_id,
+    a.title,
+    a.due_date,
+    a.priority,
+    a.points,
+    c.course_name,
+    c.color,
+    CAST(JULIANDAY(a.due_date) - JULIANDAY('now') AS INTEGER) as days_until_due
+FROM assignments a
+INNER JOIN courses c ON a.course_id = c.course_id
+WHERE a.completed = 0
+    AND a.due_date >= DATE('now')
+    AND a.due_date <= DATE('now', '+7 days')
+ORDER BY a.due_date ASC
+'''
+
+@ttl_cache(seconds=3)
 def get_assignments_due_this_week():
     """
     Get assignments due in next 7 days
     Demonstrates date filtering
     """
-    conn = get_db_connection()
+    return read_assignments_due_this_week(get_db_connection())
+
+def read_assignments_due_this_week(conn):
+    """Run the due-this-week query on conn"""
     cursor = conn.cursor()
     
-    sql = '''
-    SELECT 
-        a.assignment_id,
-        a.title,
-        a.due_date,
-        a.priority,
-        a.points,
-        c.course_name,
-        c.color,
-        JULIANDAY(a.due_date) - JULIANDAY('now') as days_until_due
-    FROM assignments a
-    INNER JOIN courses c ON a.course_id = c.course_id
-    WHERE a.completed = 0
-        AND a.due_date >= DATE('now')
-        AND a.due_date <= DATE('now', '+7 days')
-    ORDER BY a.due_date ASC
-    '''
-    
-    cursor.execute(sql)
-    rows = cursor.fetchall()
-    conn.commit()
-    conn.close()
-    
-    assignments = []
-    for row in rows:
-        assignments.append({
-            'id': row['assignment_id'],
-            'title': row['title'],
-            'dueDate': row['due_date'],
-            'priority': row['priority'],
-            'points': row['points'],
-            'courseName': row['course_name'],
-            'courseColor': row['color'],
-            'daysUntilDue': int(row['days_until_due'])
-        })
-    
-    return assignments
+    cursor.execute(SQL_GET_ASSIGNMENTS_DUE_THIS_WEEK)
+    
+    # Built straight from the cursor, without a fetchall() list in between.
+    # Unpacked by position: keep in SQL_GET_ASSIGNMENTS_DUE_THIS_WEEK order
+    return [
+        {
+            'id': assignment_id,
+            'title': title,
+            'dueDate': due_date,
+            'priority': priority,
+            'points': points,
+            'courseName': course_name,
+            'courseColor': color,
+            'daysUntilDue': days_until_due
+        }
+        for (assignment_id, title, due_date, priority, points, course_name,
+             color, days_until_due) in cursor
+    ]
+
+@ttl_cache(seconds=3)
+def get_dashboard():
+    """
+    Get statistics and this week's assignments together
+    Both queries run in one read transaction, so they see the same
+    snapshot and the read lock is taken once
+    """
+    with read_transaction() as conn:
+        return {
+            'stats': read_statistics(conn),
+            'dueThisWeek': read_assignments_due_this_week(conn)
+        }